@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for file browser TUI tests."""
+
+import pytest
+
+
+@pytest.fixture
+def make_tree(tmp_path):
+    """Return a function that creates empty files below tmp_path.
+
+    It takes paths relative to tmp_path, creates any missing parent
+    directories, and returns tmp_path.
+    """
+    def make(rel_paths):
+        for rel in rel_paths:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        return tmp_path
+
+    return make
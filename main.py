@@ -4,18 +4,53 @@
 import os
 import sys
 import json
+import functools
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
+from typing import NamedTuple
 from PIL import Image
+from textual import events, work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
-from textual.widgets import Static, Header, Footer, Label, Input, ListView, ListItem, Markdown
+from textual.widgets import Static, Header, Footer, Label, Input, ListView, ListItem
 from textual.screen import ModalScreen
 from textual.message import Message
 from textual.theme import Theme
-from rich.syntax import Syntax
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from rich.table import Table
 from rich.text import Text
-from rapidfuzz import fuzz, process
+from rapidfuzz import fuzz, process, utils
+
+
+# File type prefixes, keyed by lowercased suffix
+_SUFFIX_PREFIX = {
+    **dict.fromkeys(['.py'], "[#7dcfff]●[/#7dcfff]"),
+    **dict.fromkeys(['.js', '.ts', '.jsx', '.tsx'], "[#e0af68]●[/#e0af68]"),
+    **dict.fromkeys(['.md', '.txt', '.rst'], "[#9ece6a]●[/#9ece6a]"),
+    **dict.fromkeys(['.json', '.yaml', '.yml', '.toml'], "[#bb9af7]●[/#bb9af7]"),
+    **dict.fromkeys(['.jpg', '.jpeg', '.png', '.gif', '.svg'], "[#f7768e]●[/#f7768e]"),
+    **dict.fromkeys(['.zip', '.tar', '.gz', '.bz2'], "[#ff9e64]●[/#ff9e64]"),
+}
+
+
+# Pygments lexer names, keyed by lowercased suffix without the dot.
+# Anything missing is previewed as plain text.
+_SUFFIX_LEXER = {
+    'py': 'python', 'pyi': 'python',
+    'js': 'javascript', 'mjs': 'javascript', 'cjs': 'javascript', 'jsx': 'javascript',
+    'ts': 'typescript', 'tsx': 'typescript',
+    'txt': 'text', 'rst': 'rst',
+    'json': 'json', 'yaml': 'yaml', 'yml': 'yaml', 'toml': 'toml',
+    'ini': 'ini', 'cfg': 'ini', 'svg': 'xml', 'xml': 'xml',
+    'html': 'html', 'htm': 'html', 'css': 'css', 'scss': 'scss',
+    'sh': 'bash', 'bash': 'bash', 'zsh': 'bash',
+    'c': 'c', 'h': 'c', 'cpp': 'cpp', 'cc': 'cpp', 'hpp': 'cpp',
+    'go': 'go', 'rs': 'rust', 'rb': 'ruby', 'java': 'java', 'kt': 'kotlin',
+    'swift': 'swift', 'php': 'php', 'lua': 'lua', 'pl': 'perl', 'cs': 'csharp',
+    'sql': 'sql',
+}
 
 
 # Define custom themes
@@ -127,6 +162,35 @@ CUSTOM_THEMES = {
 }
 
 
+# Display names for the built-in themes
+THEME_DISPLAY_NAMES = {
+    "tokyo-night": "Tokyo Night",
+    "dracula": "Dracula",
+    "nord": "Nord",
+    "catppuccin-mocha": "Catppuccin Mocha",
+    "gruvbox-dark": "Gruvbox Dark",
+    "solarized-dark": "Solarized Dark",
+    "one-dark": "One Dark",
+    "monokai-pro": "Monokai Pro",
+}
+
+
+# Keybindings table shown by HelpScreen, built once since it never changes
+_HELP_TABLE = Table(show_header=False, box=None, padding=(0, 2))
+_HELP_TABLE.add_column("Key", style="bold green")
+_HELP_TABLE.add_column("Action", style="white")
+_HELP_TABLE.add_row("j / Down", "Move selection down")
+_HELP_TABLE.add_row("k / Up", "Move selection up")
+_HELP_TABLE.add_row("l / Enter", "Enter directory or select file")
+_HELP_TABLE.add_row("h", "Go back to parent directory")
+_HELP_TABLE.add_row(".", "Toggle hidden files")
+_HELP_TABLE.add_row("Ctrl+F", "Fuzzy find files")
+_HELP_TABLE.add_row("s", "Settings (change color scheme)")
+_HELP_TABLE.add_row("/", "Show this help")
+_HELP_TABLE.add_row("q", "Quit application")
+_HELP_TABLE.add_row("Esc", "Close this dialog")
+
+
 def load_custom_themes_from_file(themes_file: Path = Path("themes.json")) -> dict[str, Theme]:
     """Load custom themes from a JSON file.
 
@@ -172,6 +236,141 @@ def load_custom_themes_from_file(themes_file: Path = Path("themes.json")) -> dic
         return {}
 
 
+# rich.syntax and rich.markdown import pygments and markdown-it, so they
+# are loaded on the first preview that needs them
+_Syntax = None
+_RichMarkdown = None
+
+
+def _get_syntax():
+    """Return rich's Syntax class, importing it on first use."""
+    global _Syntax
+    if _Syntax is None:
+        from rich.syntax import Syntax as _Syntax
+    return _Syntax
+
+
+def _get_markdown():
+    """Return rich's Markdown class, importing it on first use."""
+    global _RichMarkdown
+    if _RichMarkdown is None:
+        from rich.markdown import Markdown as _RichMarkdown
+    return _RichMarkdown
+
+
+@functools.lru_cache(maxsize=64)
+def _lookup_lexer(suffix: str):
+    """Return a pygments lexer for a file suffix, falling back to plain text.
+
+    Known suffixes come from _SUFFIX_LEXER; anything else is tried as a
+    pygments alias once. The lexer instance is handed to Syntax directly,
+    so the registry is not searched again on every render.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    # Same options rich.syntax.Syntax uses when it resolves a lexer name
+    options = {"stripnl": False, "ensurenl": True, "tabsize": 4}
+    name = _SUFFIX_LEXER.get(suffix)
+    if name is None and suffix:
+        try:
+            return get_lexer_by_name(suffix, **options)
+        except ClassNotFound:
+            pass
+    return get_lexer_by_name(name or 'text', **options)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Permission triplets indexed by a 3-bit rwx value
+_RWX = ('---', '--x', '-w-', '-wx', 'r--', 'r-x', 'rw-', 'rwx')
+
+
+@functools.lru_cache(maxsize=512)
+def _format_perms(mode: int) -> str:
+    """Format the permission bits of a mode as an rwxrwxrwx string."""
+    return _RWX[(mode >> 6) & 7] + _RWX[(mode >> 3) & 7] + _RWX[mode & 7]
+
+
+@functools.lru_cache(maxsize=512)
+def _format_size(size: int) -> str:
+    """Format file size in human-readable format."""
+    if size < 1024:
+        return f"{size} B"
+    # Each unit is 2**10 times the previous one
+    unit = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_prefix(name: str) -> str:
+    """Return the colored file type prefix for a file name."""
+    return _SUFFIX_PREFIX.get(os.path.splitext(name)[1].lower(), "·")
+
+
+def _walk_tree(root: str, skip_dirs: frozenset[str], show_hidden: bool = False) -> Iterator[os.DirEntry]:
+    """Yield every entry below root, depth first.
+
+    Hidden entries are skipped (and hidden directories not descended
+    into) unless show_hidden is set. Directories named in skip_dirs and
+    directories that cannot be read are always skipped. The walk uses
+    an explicit stack so deep trees cannot hit the recursion limit.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Skip hidden files and directories
+                    if not show_hidden and entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in skip_dirs:
+                            continue
+                        stack.append(entry.path)
+                    yield entry
+        except OSError:
+            # Unreadable directory; skip it and keep walking
+            continue
+
+
+# Directory path -> (mtime_ns, dir_count, file_count), shared by the
+# preview pane and the info boxes, least recently used first
+_DIR_COUNT_CACHE: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+# Number of directories whose counts are kept
+_DIR_COUNT_CACHE_SIZE = 256
+
+
+def _count_dir_entries(path: Path) -> tuple[int, int]:
+    """Count the subdirectories and files directly inside path.
+
+    Returns a (dir_count, file_count) tuple. Counts are cached until the
+    directory's mtime changes, which happens whenever an entry is added,
+    removed or renamed. Only the most recently used directories are kept.
+    """
+    key = str(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _DIR_COUNT_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        _DIR_COUNT_CACHE.move_to_end(key)
+        return cached[1], cached[2]
+
+    dir_count = 0
+    file_count = 0
+    with os.scandir(key) as it:
+        for entry in it:
+            if entry.is_dir():
+                dir_count += 1
+            else:
+                file_count += 1
+    _DIR_COUNT_CACHE[key] = (mtime, dir_count, file_count)
+    # A stale entry is replaced in place, so move it to the recent end
+    _DIR_COUNT_CACHE.move_to_end(key)
+    if len(_DIR_COUNT_CACHE) > _DIR_COUNT_CACHE_SIZE:
+        _DIR_COUNT_CACHE.popitem(last=False)
+    return dir_count, file_count
+
+
 class HelpScreen(ModalScreen[None]):
     """Modal screen showing keybindings help."""
 
@@ -216,23 +415,7 @@ class HelpScreen(ModalScreen[None]):
         with Container(id="help-dialog"):
             yield Static("[bold cyan]File Browser Keybindings[/bold cyan]\n", id="help-title")
 
-            # Create a table with keybindings
-            table = Table(show_header=False, box=None, padding=(0, 2))
-            table.add_column("Key", style="bold green")
-            table.add_column("Action", style="white")
-
-            table.add_row("j / Down", "Move selection down")
-            table.add_row("k / Up", "Move selection up")
-            table.add_row("l / Enter", "Enter directory or select file")
-            table.add_row("h", "Go back to parent directory")
-            table.add_row(".", "Toggle hidden files")
-            table.add_row("Ctrl+F", "Fuzzy find files")
-            table.add_row("s", "Settings (change color scheme)")
-            table.add_row("/", "Show this help")
-            table.add_row("q", "Quit application")
-            table.add_row("Esc", "Close this dialog")
-
-            yield Static(table, id="help-content")
+            yield Static(_HELP_TABLE, id="help-content")
             yield Static("\n[dim]Press Esc, q, or / to close[/dim]", id="help-footer")
 
     def on_mount(self) -> None:
@@ -292,17 +475,8 @@ class SettingsScreen(ModalScreen[str | None]):
         self.selected_index = 0
         self.all_themes = all_themes
 
-        # Create display names for built-in themes
-        self.theme_display_names = {
-            "tokyo-night": "Tokyo Night",
-            "dracula": "Dracula",
-            "nord": "Nord",
-            "catppuccin-mocha": "Catppuccin Mocha",
-            "gruvbox-dark": "Gruvbox Dark",
-            "solarized-dark": "Solarized Dark",
-            "one-dark": "One Dark",
-            "monokai-pro": "Monokai Pro",
-        }
+        # Start from the built-in theme display names
+        self.theme_display_names = THEME_DISPLAY_NAMES.copy()
 
         # Add display names from loaded themes
         for theme_name, theme in all_themes.items():
@@ -328,13 +502,15 @@ class SettingsScreen(ModalScreen[str | None]):
         """Populate the list when mounted."""
         list_view = self.query_one("#settings-list", ListView)
 
+        items = []
         for i, theme_key in enumerate(self.themes):
             display_name = self.theme_display_names.get(theme_key, theme_key)
             if i == self.selected_index:
                 label = Label(f"▸ [bold cyan]{display_name}[/bold cyan]  [dim](current)[/dim]")
             else:
                 label = Label(f"  {display_name}")
-            list_view.append(ListItem(label))
+            items.append(ListItem(label))
+        list_view.extend(items)
 
         list_view.index = self.selected_index
 
@@ -371,6 +547,17 @@ class SettingsScreen(ModalScreen[str | None]):
         list_view.action_cursor_up()
 
 
+class FuzzyResults(Message):
+    """Fuzzy matches computed by the fuzzy finder's search worker."""
+
+    def __init__(self, query: str, indices: list[int], generation: int) -> None:
+        super().__init__()
+        self.query = query
+        # Indices into the finder's file list, best match first
+        self.indices = indices
+        self.generation = generation
+
+
 class FuzzyFinderScreen(ModalScreen[Path | None]):
     """Modal screen for fuzzy finding files."""
 
@@ -424,11 +611,41 @@ class FuzzyFinderScreen(ModalScreen[Path | None]):
         ("ctrl+c", "dismiss_finder", "Close"),
     ]
 
-    def __init__(self, current_path: Path, *args, **kwargs):
+    # Number of paths collected before results are pushed to the UI
+    BATCH_SIZE = 500
+    # Seconds between result refreshes while files are still being collected
+    COLLECT_REFRESH_DELAY = 0.5
+    # Maximum number of results shown
+    MAX_RESULTS = 100
+    # Directory names that are never descended into
+    SKIP_DIRS = frozenset({'__pycache__', 'node_modules', '.git', '.venv'})
+    # Seconds to wait after the last keystroke before searching
+    SEARCH_DELAY = 0.15
+    # Below this many partial_ratio hits, WRatio is tried as a fallback
+    MIN_PARTIAL_HITS = 20
+
+    def __init__(self, current_path: Path, show_hidden: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.current_path = current_path
-        self.all_files: list[Path] = []
-        self.filtered_files: list[Path] = []
+        self.show_hidden = show_hidden
+        # (lowercased name, path, is_dir) records for every collected entry
+        self.all_files: list[tuple[str, str, bool]] = []
+        self.filtered_files: list[str] = []
+        # Paths relative to current_path, index-aligned with all_files
+        self._rel_strings: list[str] = []
+        # rapidfuzz-preprocessed relative paths that are matched against
+        self._processed: list[str] = []
+        self._base = os.path.join(str(current_path), "")
+        # Labels for the unfiltered (empty query) view, built on demand
+        self._empty_labels: list[str] | None = None
+        self._showing_empty = False
+        self._debounce: Timer | None = None
+        self._latest_query = ""
+        # Throttle state for refreshing results while files are collected
+        self._collect_refresh: Timer | None = None
+        self._collect_dirty = False
+        # Bumped whenever all_files is reordered so in-flight searches are ignored
+        self._generation = 0
 
     def compose(self) -> ComposeResult:
         """Create the fuzzy finder dialog."""
@@ -437,95 +654,261 @@ class FuzzyFinderScreen(ModalScreen[Path | None]):
             yield ListView(id="fuzzy-results")
 
     def on_mount(self) -> None:
-        """Collect all files and focus input when mounted."""
-        self.collect_files()
+        """Start collecting files and focus input when mounted."""
         self.query_one(Input).focus()
-        self.update_results("")
+        self._collector = self.collect_files()
 
+    def on_unmount(self) -> None:
+        """Stop collecting files once the finder is closed."""
+        self._collector.cancel()
+
+    @work(exclusive=True, thread=True, group="collect-files")
     def collect_files(self) -> None:
-        """Recursively collect all files from current directory."""
-        try:
-            # Use rglob to recursively find all files
-            self.all_files = []
-            for path in self.current_path.rglob("*"):
-                # Skip hidden files and directories
-                if any(part.startswith('.') for part in path.parts):
-                    continue
-                self.all_files.append(path)
-
-            # Sort by name
-            self.all_files.sort(key=lambda x: x.name.lower())
-        except PermissionError:
-            self.all_files = []
+        """Recursively collect all files from current directory.
+
+        Runs in a worker thread and streams results to the UI in batches.
+        Hidden directories and SKIP_DIRS are skipped without being
+        descended into. Path preprocessing and the final sort also happen
+        here, so the UI thread only appends finished lists.
+        """
+        worker = get_current_worker()
+        records: list[tuple[str, str, bool]] = []
+        rel_strings: list[str] = []
+        processed: list[str] = []
+        batch: list[tuple[str, str, bool]] = []
+
+        for entry in _walk_tree(str(self.current_path), self.SKIP_DIRS, self.show_hidden):
+            # Label symlinks by their target, as FileList does; the walk
+            # itself never descends into them
+            batch.append((entry.name.lower(), entry.path, entry.is_dir()))
+            if len(batch) >= self.BATCH_SIZE:
+                if worker.is_cancelled:
+                    return
+                batch_rel = self._relative_paths([r[1] for r in batch])
+                batch_processed = [utils.default_process(s) for s in batch_rel]
+                records.extend(batch)
+                rel_strings.extend(batch_rel)
+                processed.extend(batch_processed)
+                self.app.call_from_thread(self._add_files, batch, batch_rel, batch_processed)
+                batch = []
+
+        if worker.is_cancelled:
+            return
+        batch_rel = self._relative_paths([r[1] for r in batch])
+        records.extend(batch)
+        rel_strings.extend(batch_rel)
+        processed.extend(utils.default_process(s) for s in batch_rel)
+
+        # Sort by name; records lead with the lowercased name, so they
+        # compare as plain tuples
+        order = sorted(range(len(records)), key=records.__getitem__)
+        records = [records[i] for i in order]
+        rel_strings = [rel_strings[i] for i in order]
+        processed = [processed[i] for i in order]
+
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._set_files, records, rel_strings, processed)
+
+    def _add_files(
+        self,
+        batch: list[tuple[str, str, bool]],
+        rel_strings: list[str],
+        processed: list[str],
+    ) -> None:
+        """Append a batch of collected records.
+
+        The first batch refreshes the results immediately; later batches
+        within COLLECT_REFRESH_DELAY only mark them dirty, so results are
+        refreshed at most once per delay while collection is running.
+        """
+        if not self.is_attached:
+            return
+        self.all_files.extend(batch)
+        self._rel_strings.extend(rel_strings)
+        self._processed.extend(processed)
+        if self._collect_refresh is None:
+            self._refresh_collected()
+            self._collect_refresh = self.set_timer(self.COLLECT_REFRESH_DELAY, self._flush_collected)
+        else:
+            self._collect_dirty = True
+
+    def _flush_collected(self) -> None:
+        """Apply a refresh deferred by _add_files."""
+        self._collect_refresh = None
+        if not self._collect_dirty:
+            return
+        self._collect_dirty = False
+        self._refresh_collected()
+        self._collect_refresh = self.set_timer(self.COLLECT_REFRESH_DELAY, self._flush_collected)
+
+    def _refresh_collected(self) -> None:
+        """Refresh the results with the files collected so far."""
+        query = self.query_one(Input).value
+        if not utils.default_process(query):
+            # The unfiltered view shows the first records in collection
+            # order, which cannot change until the final sort
+            if self._empty_labels is not None and len(self._empty_labels) >= self.MAX_RESULTS:
+                return
+            self._empty_labels = None
+            self._showing_empty = False
+        self.update_results(query)
+
+    def _set_files(
+        self,
+        records: list[tuple[str, str, bool]],
+        rel_strings: list[str],
+        processed: list[str],
+    ) -> None:
+        """Install the complete, sorted file list and refresh the results."""
+        if not self.is_attached:
+            return
+        if self._collect_refresh is not None:
+            self._collect_refresh.stop()
+            self._collect_refresh = None
+        self._collect_dirty = False
+        self.all_files = records
+        self._rel_strings = rel_strings
+        self._processed = processed
+        # Indices changed, so previous results are stale
+        self._generation += 1
+        self._empty_labels = None
+        self._showing_empty = False
+        self.update_results(self.query_one(Input).value)
+
+    def _relative_paths(self, paths: list[str]) -> list[str]:
+        """Strip the search root from each path."""
+        base = self._base
+        base_len = len(base)
+        return [p[base_len:] if p.startswith(base) else p for p in paths]
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle input changes and update filtered results."""
-        self.update_results(event.value)
+        """Handle input changes and update filtered results.
+
+        Searches are debounced so a burst of keystrokes runs one search.
+        """
+        self._latest_query = event.value
+        if self._debounce is not None:
+            self._debounce.stop()
+            self._debounce = None
+
+        if not event.value:
+            # Clearing the query shows the unfiltered list right away
+            self.update_results("")
+            return
+
+        self._debounce = self.set_timer(self.SEARCH_DELAY, self._run_search)
+
+    def _run_search(self) -> None:
+        """Search for the most recent query once typing pauses."""
+        self._debounce = None
+        self.update_results(self._latest_query)
 
     def update_results(self, query: str) -> None:
-        """Update the results list based on fuzzy matching."""
-        results_list = self.query_one(ListView)
-        results_list.clear()
+        """Update the results list based on fuzzy matching.
 
+        Non-empty queries are matched in a background worker and shown
+        when its FuzzyResults message arrives.
+        """
+        # Preprocess the query the same way as the choices
+        query = utils.default_process(query)
         if not query:
-            # Show all files if no query
-            self.filtered_files = self.all_files[:100]  # Limit to first 100
-        else:
-            # Create a mapping of string paths to Path objects for fuzzy matching
-            path_strings = {}
-            for path in self.all_files:
-                try:
-                    rel_path_str = str(path.relative_to(self.current_path))
-                except ValueError:
-                    rel_path_str = str(path)
-                path_strings[rel_path_str] = path
+            # Show all files if no query, skipping the rebuild when the
+            # unfiltered list is already on screen
+            if self._showing_empty:
+                return
+            if self._empty_labels is None:
+                self._empty_labels = [
+                    self._make_label(i) for i in range(min(len(self.all_files), self.MAX_RESULTS))
+                ]
+            self.filtered_files = [r[1] for r in self.all_files[:len(self._empty_labels)]]
+            items = [ListItem(Label(label)) for label in self._empty_labels]
+            results_list = self.query_one(ListView)
+            with self.app.batch_update():
+                results_list.clear()
+                results_list.extend(items)
+            self._showing_empty = True
+            return
 
-            # Use rapidfuzz to find matches
-            matches = process.extract(
+        # Every search scores the whole file list. partial_ratio is not
+        # monotone in the query (a path that misses the cutoff for "a" can
+        # pass it for "ax"), so the previous query's matches cannot be used
+        # to narrow the next search. The list grows while files are still
+        # being collected, so the worker searches a snapshot.
+        self._search(query, self._processed[:], self._generation)
+
+    @work(exclusive=True, thread=True, group="fuzzy-search")
+    def _search(self, query: str, choices: list[str], generation: int) -> None:
+        """Run fuzzy matching in a worker thread and post the results.
+
+        rapidfuzz releases the GIL while scoring, so the UI stays
+        responsive during large searches.
+        """
+        # Use rapidfuzz to find matches; each match carries its index.
+        # Choices are preprocessed up front so no processor is needed.
+        matches = process.extract(
+            query,
+            choices,
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            score_cutoff=50,
+            limit=self.MAX_RESULTS
+        )
+        if len(matches) < self.MIN_PARTIAL_HITS:
+            # Few substring-style hits: let WRatio add matches that only
+            # line up with typos or reordered tokens
+            seen = {match[2] for match in matches}
+            fallback = process.extract(
                 query,
-                path_strings.keys(),
+                choices,
                 scorer=fuzz.WRatio,
-                limit=100
+                processor=None,
+                score_cutoff=50,
+                limit=self.MAX_RESULTS
             )
-            self.filtered_files = [path_strings[match[0]] for match in matches]
+            matches += [match for match in fallback if match[2] not in seen]
 
-        # Add results to ListView
-        for file_path in self.filtered_files:
-            try:
-                rel_path = file_path.relative_to(self.current_path)
-                path_str = str(rel_path)
-            except ValueError:
-                path_str = str(file_path)
+        indices = [match[2] for match in matches[:self.MAX_RESULTS]]
+        if not get_current_worker().is_cancelled:
+            self.post_message(FuzzyResults(query, indices, generation))
 
-            # Add prefix based on type
-            if file_path.is_dir():
-                prefix = "▸"
-                label = f" {prefix} [bold #7dcfff]{path_str}/[/bold #7dcfff]"
-            else:
-                suffix = file_path.suffix.lower()
-                if suffix in ['.py']:
-                    prefix = "[#7dcfff]●[/#7dcfff]"
-                elif suffix in ['.js', '.ts', '.jsx', '.tsx']:
-                    prefix = "[#e0af68]●[/#e0af68]"
-                elif suffix in ['.md', '.txt', '.rst']:
-                    prefix = "[#9ece6a]●[/#9ece6a]"
-                elif suffix in ['.json', '.yaml', '.yml', '.toml']:
-                    prefix = "[#bb9af7]●[/#bb9af7]"
-                elif suffix in ['.jpg', '.jpeg', '.png', '.gif', '.svg']:
-                    prefix = "[#f7768e]●[/#f7768e]"
-                elif suffix in ['.zip', '.tar', '.gz', '.bz2']:
-                    prefix = "[#ff9e64]●[/#ff9e64]"
-                else:
-                    prefix = "·"
-                label = f" {prefix} [#c0caf5]{path_str}[/#c0caf5]"
-
-            results_list.append(ListItem(Label(label)))
+    def on_fuzzy_results(self, event: FuzzyResults) -> None:
+        """Show search results unless the query or file list has moved on."""
+        if event.generation != self._generation:
+            return
+        if event.query != utils.default_process(self.query_one(Input).value):
+            return
+
+        indices = event.indices
+
+        self.filtered_files = [self.all_files[i][1] for i in indices]
+        self._showing_empty = False
+
+        # Add results to ListView in a single batch
+        results_list = self.query_one(ListView)
+        items = [ListItem(Label(self._make_label(i))) for i in indices]
+        with self.app.batch_update():
+            results_list.clear()
+            results_list.extend(items)
+
+    def _make_label(self, index: int) -> str:
+        """Build the result label markup for the file at index."""
+        name, _, is_dir = self.all_files[index]
+        path_str = self._rel_strings[index]
+
+        # Add prefix based on type
+        if is_dir:
+            prefix = "▸"
+            return f" {prefix} [bold #7dcfff]{path_str}/[/bold #7dcfff]"
+
+        # Look up by name; paths are unique and would never hit the cache
+        prefix = _file_prefix(name)
+        return f" {prefix} [#c0caf5]{path_str}[/#c0caf5]"
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle file selection."""
         if event.list_view.index is not None and event.list_view.index < len(self.filtered_files):
             selected_path = self.filtered_files[event.list_view.index]
-            self.dismiss(selected_path)
+            self.dismiss(Path(selected_path))
 
     def action_dismiss_finder(self) -> None:
         """Dismiss the finder without selection."""
@@ -545,6 +928,15 @@ class InfoBox(Static):
         self.update(content)
 
 
+class FileEntry(NamedTuple):
+    """A directory listing entry captured from a single scandir pass."""
+
+    is_dir: bool
+    name: str
+    name_lower: str
+    path: str
+
+
 class FileList(Static):
     """Widget to display the list of files and directories."""
 
@@ -553,7 +945,13 @@ class FileList(Static):
         self.current_path = Path.cwd()
         self.selected_index = 0
         self.show_hidden = False
-        self.entries = []
+        self.entries: list[FileEntry] = []
+        # Position of each entry keyed by its path string
+        self._entry_index: dict[str, int] = {}
+        # Pre-rendered markup per entry, plain and highlighted
+        self._plain_lines: list[str] = []
+        self._selected_lines: list[str] = []
+        self._lines: list[str] = []
 
     def on_mount(self):
         """Initialize the file list when mounted."""
@@ -563,20 +961,31 @@ class FileList(Static):
     def refresh_list(self):
         """Refresh the file list based on current directory."""
         try:
-            entries = list(self.current_path.iterdir())
+            with os.scandir(self.current_path) as it:
+                entries = list(it)
 
             # Filter hidden files if needed
             if not self.show_hidden:
                 entries = [e for e in entries if not e.name.startswith('.')]
 
-            # Sort: directories first, then files, alphabetically
-            entries.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+            # Capture everything rendering needs once. DirEntry.is_dir() is
+            # answered from the scandir result, so this costs no extra stat
+            # for regular entries.
+            records = [FileEntry(e.is_dir(), e.name, e.name.lower(), e.path) for e in entries]
+
+            # Sort: directories first, then files, alphabetically. The sort
+            # keys are precomputed so the sort compares plain tuples.
+            decorated = [(not r.is_dir, r.name_lower, r) for r in records]
+            decorated.sort()
+            records = [r for _, _, r in decorated]
 
             # Always add parent directory at the top if not at root
-            if self.current_path != self.current_path.parent:
-                self.entries = [self.current_path.parent] + entries
+            parent = self.current_path.parent
+            if self.current_path != parent:
+                self.entries = [FileEntry(True, "..", "..", str(parent))] + records
             else:
-                self.entries = entries
+                self.entries = records
+            self._entry_index = {entry.path: i for i, entry in enumerate(self.entries)}
 
             self.selected_index = 0
             self.render_list()
@@ -585,78 +994,71 @@ class FileList(Static):
 
     def render_list(self):
         """Render the file list with selection highlight."""
-        lines = []
+        self._plain_lines = []
+        self._selected_lines = []
         for i, entry in enumerate(self.entries):
-            # Determine the display name
-            if i == 0 and entry == self.current_path.parent:
-                name = ".."
+            name = entry.name
+            # Determine the prefix
+            if i == 0 and name == "..":
                 prefix = "[dim]◄[/dim]"
+            elif entry.is_dir:
+                prefix = "▸"
             else:
-                name = entry.name
-                # Add prefix based on type
-                if entry.is_dir():
-                    prefix = "▸"
-                else:
-                    # Add file type prefixes
-                    suffix = entry.suffix.lower()
-                    if suffix in ['.py']:
-                        prefix = "[#7dcfff]●[/#7dcfff]"
-                    elif suffix in ['.js', '.ts', '.jsx', '.tsx']:
-                        prefix = "[#e0af68]●[/#e0af68]"
-                    elif suffix in ['.md', '.txt', '.rst']:
-                        prefix = "[#9ece6a]●[/#9ece6a]"
-                    elif suffix in ['.json', '.yaml', '.yml', '.toml']:
-                        prefix = "[#bb9af7]●[/#bb9af7]"
-                    elif suffix in ['.jpg', '.jpeg', '.png', '.gif', '.svg']:
-                        prefix = "[#f7768e]●[/#f7768e]"
-                    elif suffix in ['.zip', '.tar', '.gz', '.bz2']:
-                        prefix = "[#ff9e64]●[/#ff9e64]"
-                    else:
-                        prefix = "·"
+                # Add file type prefixes
+                prefix = _file_prefix(name)
 
             # Color based on type
-            if entry.is_dir():
+            if entry.is_dir:
                 colored_name = f"[bold #7dcfff]{name}/[/bold #7dcfff]"
             else:
                 colored_name = f"[#c0caf5]{name}[/#c0caf5]"
 
-            # Highlight selected item
-            if i == self.selected_index:
-                lines.append(f"[reverse] {prefix} {colored_name} [/reverse]")
-            else:
-                lines.append(f" {prefix} {colored_name}")
+            self._plain_lines.append(f" {prefix} {colored_name}")
+            self._selected_lines.append(f"[reverse] {prefix} {colored_name} [/reverse]")
+
+        # Highlight selected item
+        self._lines = self._plain_lines.copy()
+        if 0 <= self.selected_index < len(self._lines):
+            self._lines[self.selected_index] = self._selected_lines[self.selected_index]
 
-        self.update("\n".join(lines))
+        self.update("\n".join(self._lines))
+
+    def set_selection(self, new_index: int):
+        """Move the highlight by swapping only the two affected lines."""
+        old_index = self.selected_index
+        self.selected_index = new_index
+        self._lines[old_index] = self._plain_lines[old_index]
+        self._lines[new_index] = self._selected_lines[new_index]
+        self.update("\n".join(self._lines))
 
     def get_selected_entry(self):
         """Get the currently selected path."""
         if 0 <= self.selected_index < len(self.entries):
-            return self.entries[self.selected_index]
+            return Path(self.entries[self.selected_index].path)
         return None
 
     def move_selection_up(self):
         """Move selection up one item."""
         if self.selected_index > 0:
-            self.selected_index -= 1
-            self.render_list()
+            self.set_selection(self.selected_index - 1)
             return True
         return False
 
     def move_selection_down(self):
         """Move selection down one item."""
         if self.selected_index < len(self.entries) - 1:
-            self.selected_index += 1
-            self.render_list()
+            self.set_selection(self.selected_index + 1)
             return True
         return False
 
     def enter_selected(self):
         """Enter the selected directory or preview file."""
-        selected = self.get_selected_entry()
-        if selected and selected.is_dir():
-            self.current_path = selected
-            self.refresh_list()
-            return True
+        if 0 <= self.selected_index < len(self.entries):
+            entry = self.entries[self.selected_index]
+            if entry.is_dir:
+                self.current_path = Path(entry.path)
+                self.refresh_list()
+                return True
         return False
 
     def toggle_hidden_files(self):
@@ -668,8 +1070,25 @@ class FileList(Static):
 class FilePreview(Static):
     """Widget to display file preview."""
 
+    # Maximum number of lines shown in the text preview
+    PREVIEW_LINES = 1000
+    # Lines read beyond the visible pane height
+    PREVIEW_OVERSCAN = 20
+    # Bytes read per previewed line, which also bounds the text highlighted
+    AVG_LINE_BYTES = 200
+    # Leading bytes checked for NUL when deciding whether a file is binary
+    BINARY_SNIFF_BYTES = 8192
+    # Number of rendered previews kept for quick re-selection
+    PREVIEW_CACHE_SIZE = 32
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # (path, mtime_ns, size, line limit) -> renderable, least recently used first
+        self._preview_cache: OrderedDict[tuple[str, int, int, int], object] = OrderedDict()
+        # Text file on screen and the line limit it was read with, so it can
+        # be read again when the pane grows
+        self._text_path: Path | None = None
+        self._text_lines = 0
 
     def on_mount(self):
         """Initialize the preview pane when mounted."""
@@ -678,6 +1097,7 @@ class FilePreview(Static):
 
     def preview_file(self, path: Path):
         """Preview the contents of a file."""
+        self._text_path = None
         if not path.exists():
             self.update("[red]File not found[/red]")
             return
@@ -685,9 +1105,7 @@ class FilePreview(Static):
         if path.is_dir():
             # Show directory contents count
             try:
-                entries = list(path.iterdir())
-                dir_count = sum(1 for e in entries if e.is_dir())
-                file_count = len(entries) - dir_count
+                dir_count, file_count = _count_dir_entries(path)
                 self.update(f"[dim]Directory[/dim]\n\n{dir_count} directories\n{file_count} files")
             except PermissionError:
                 self.update("[dim]Directory[/dim]\n\n[red]Permission denied[/red]")
@@ -695,7 +1113,8 @@ class FilePreview(Static):
 
         try:
             # Get file size and extension
-            file_size = path.stat().st_size
+            stat_info = path.stat()
+            file_size = stat_info.st_size
             suffix = path.suffix.lstrip('.').lower()
 
             # Check if it's an image file
@@ -706,61 +1125,95 @@ class FilePreview(Static):
                     return
                 except Exception as e:
                     # If image preview fails, show error and continue to text preview
-                    self.update(f"[yellow]Could not preview image[/yellow]\n\n{str(e)}\n\nSize: {self._format_size(file_size)}")
+                    self.update(f"[yellow]Could not preview image[/yellow]\n\n{str(e)}\n\nSize: {_format_size(file_size)}")
                     return
 
-            # If file is too large, show warning
-            if file_size > 1_000_000:  # 1MB
-                self.update(f"[yellow]File too large to preview[/yellow]\n\nSize: {self._format_size(file_size)}")
+            max_lines = self._max_preview_lines()
+            max_bytes = max_lines * self.AVG_LINE_BYTES
+
+            # Reuse the rendered preview if the file is unchanged
+            key = (str(path), stat_info.st_mtime_ns, file_size, max_lines)
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                self._preview_cache.move_to_end(key)
+                self.update(cached)
+                self._text_path = path
+                self._text_lines = max_lines
                 return
 
-            # Try to read as text
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                # Limit to first 1000 lines
-                lines = []
-                for i, line in enumerate(f):
-                    if i >= 1000:
-                        lines.append("\n[dim]... (preview truncated)[/dim]")
-                        break
-                    lines.append(line.rstrip('\n'))
-                content = '\n'.join(lines)
-
-                if not content:
-                    self.update("[dim]Empty file[/dim]")
-                    return
+            # Read a bounded head of the file and decode it in one pass.
+            # One extra byte tells a truncated file from one exactly at the cap.
+            with open(path, 'rb') as f:
+                data = f.read(min(file_size, max_bytes) + 1)
+
+            # Text files practically never contain NUL bytes; skip decoding
+            # and highlighting anything that does
+            if b'\x00' in data[:self.BINARY_SNIFF_BYTES]:
+                self.update(f"[yellow]Binary file[/yellow]\n\nSize: {_format_size(file_size)}")
+                return
+
+            truncated = len(data) > max_bytes
+            content = data[:max_bytes].decode('utf-8', errors='replace')
+
+            # Enforce the line limit with one split instead of a line loop.
+            # An empty remainder is just the final newline of a file that
+            # has exactly max_lines lines.
+            lines = content.split('\n', max_lines)
+            if len(lines) > max_lines:
+                content = '\n'.join(lines[:max_lines])
+                if lines[max_lines]:
+                    truncated = True
+            if truncated:
+                content += "\n... (preview truncated)"
+
+            if not content:
+                self.update("[dim]Empty file[/dim]")
+                return
 
-                # Get file extension for syntax detection
-                suffix = path.suffix.lstrip('.').lower()
-
-                # Render markdown files with Textual's Markdown widget
-                if suffix in ['md', 'markdown']:
-                    try:
-                        # Create a Markdown widget inline
-                        from rich.markdown import Markdown as RichMarkdown
-                        md = RichMarkdown(content)
-                        self.update(md)
-                    except Exception:
-                        # Fallback to plain text if markdown rendering fails
-                        self.update(content)
-                else:
-                    # Try to apply syntax highlighting using Rich
-                    try:
-                        if suffix:
-                            syntax = Syntax(content, suffix, theme="monokai", line_numbers=False)
-                            self.update(syntax)
-                        else:
-                            # No extension, display as plain text
-                            self.update(content)
-                    except Exception:
-                        # If syntax highlighting fails, display as plain text
-                        self.update(content)
-        except UnicodeDecodeError:
-            self.update(f"[yellow]Binary file[/yellow]\n\nSize: {self._format_size(file_size)}")
+            if suffix in ['md', 'markdown']:
+                # Render markdown files with Rich's Markdown renderable
+                try:
+                    renderable = _get_markdown()(content)
+                except Exception:
+                    # Fallback to plain text if markdown rendering fails
+                    renderable = content
+            else:
+                # Apply syntax highlighting using Rich with a cached lexer
+                renderable = _get_syntax()(content, _lookup_lexer(suffix), theme="monokai", line_numbers=False, word_wrap=False)
+
+            self._preview_cache[key] = renderable
+            if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+            self.update(renderable)
+            self._text_path = path
+            self._text_lines = max_lines
         except PermissionError:
             self.update("[red]Permission denied[/red]")
         except Exception as e:
             self.update(f"[red]Error: {str(e)}[/red]")
 
+    def fit_to_pane(self) -> None:
+        """Read the current text file again if the pane now fits more lines."""
+        if self._text_path is not None and self._max_preview_lines() > self._text_lines:
+            self.preview_file(self._text_path)
+
+    def _max_preview_lines(self) -> int:
+        """Return how many lines a text preview needs to fill the pane.
+
+        The pane does not scroll, so lines below it are never seen. The
+        widget itself is auto-height, so the space its container gives it
+        is measured instead. Before the first layout the terminal height
+        bounds the pane.
+        """
+        parent = self.parent
+        if parent is not None and parent.size.height:
+            height = parent.size.height - self.styles.gutter.height
+        elif self.is_attached:
+            height = self.app.size.height
+        else:
+            return self.PREVIEW_LINES
+        return min(max(height, 0) + self.PREVIEW_OVERSCAN, self.PREVIEW_LINES)
+
     def _preview_image(self, path: Path, file_size: int):
         """Preview an image file using terminal graphics or ASCII art fallback."""
         try:
@@ -826,7 +1279,7 @@ class FilePreview(Static):
                 Text(f"Format: {format_name}", style="dim"),
                 Text(f"Dimensions: {width}x{height}", style="dim"),
                 Text(f"Mode: {mode}", style="dim"),
-                Text(f"Size: {self._format_size(file_size)}", style="dim"),
+                Text(f"Size: {_format_size(file_size)}", style="dim"),
             ]
 
             self.update(Group(*info_parts))
@@ -834,13 +1287,17 @@ class FilePreview(Static):
         except Exception as e:
             raise Exception(f"Image preview error: {str(e)}")
 
-    def _format_size(self, size: int) -> str:
-        """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+
+class MainPanes(Horizontal):
+    """Row holding the file list and the preview."""
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Let the preview fill the pane after the row changes size.
+
+        The preview is auto-height, so it gets no resize event of its own
+        when only the terminal height changes.
+        """
+        self.query_one(FilePreview).fit_to_pane()
 
 
 class FileBrowserApp(App):
@@ -941,6 +1398,10 @@ class FileBrowserApp(App):
         (".", "toggle_hidden", "Toggle Hidden"),
     ]
 
+    # Seconds over which preview/info refreshes are coalesced while the
+    # selection moves quickly (e.g. holding j)
+    REFRESH_DELAY = 0.06
+
     def __init__(self):
         super().__init__()
 
@@ -956,6 +1417,11 @@ class FileBrowserApp(App):
         # Set default theme
         self.theme = "tokyo-night"
 
+        # Deferred preview/info refresh state for rapid cursor movement
+        self._refresh_timer: Timer | None = None
+        self._preview_dirty = False
+        self._info_dirty = False
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
@@ -969,7 +1435,7 @@ class FileBrowserApp(App):
 
         # Main content area
         with Container(id="main-container"):
-            with Horizontal():
+            with MainPanes():
                 yield FileList(id="file-list")
                 yield FilePreview(id="file-preview")
 
@@ -998,9 +1464,7 @@ class FileBrowserApp(App):
             # Directory size (count of items)
             if selected.is_dir():
                 try:
-                    entries = list(selected.iterdir())
-                    dir_count = sum(1 for e in entries if e.is_dir())
-                    file_count = len(entries) - dir_count
+                    dir_count, file_count = _count_dir_entries(selected)
                     self.query_one("#dir-size", InfoBox).update_content(
                         f"{dir_count} dirs, {file_count} files"
                     )
@@ -1011,9 +1475,7 @@ class FileBrowserApp(App):
             else:
                 # Show current directory info
                 try:
-                    parent_entries = list(file_list.current_path.iterdir())
-                    dir_count = sum(1 for e in parent_entries if e.is_dir())
-                    file_count = len(parent_entries) - dir_count
+                    dir_count, file_count = _count_dir_entries(file_list.current_path)
                     self.query_one("#dir-size", InfoBox).update_content(
                         f"{dir_count} dirs, {file_count} files"
                     )
@@ -1023,36 +1485,18 @@ class FileBrowserApp(App):
                 # File size
                 size = stat_info.st_size
                 self.query_one("#file-size", InfoBox).update_content(
-                    self._format_size(size)
+                    _format_size(size)
                 )
 
             # Permissions
-            mode = stat_info.st_mode
-            perms = []
-            perms.append('r' if mode & 0o400 else '-')
-            perms.append('w' if mode & 0o200 else '-')
-            perms.append('x' if mode & 0o100 else '-')
-            perms.append('r' if mode & 0o040 else '-')
-            perms.append('w' if mode & 0o020 else '-')
-            perms.append('x' if mode & 0o010 else '-')
-            perms.append('r' if mode & 0o004 else '-')
-            perms.append('w' if mode & 0o002 else '-')
-            perms.append('x' if mode & 0o001 else '-')
-            self.query_one("#permissions", InfoBox).update_content(''.join(perms))
+            perms = _format_perms(stat_info.st_mode & 0o777)
+            self.query_one("#permissions", InfoBox).update_content(perms)
 
         except Exception as e:
             self.query_one("#dir-size", InfoBox).update_content("Error")
             self.query_one("#file-size", InfoBox).update_content("Error")
             self.query_one("#permissions", InfoBox).update_content("Error")
 
-    def _format_size(self, size: int) -> str:
-        """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
-
     def action_show_help(self):
         """Show help dialog."""
         self.push_screen(HelpScreen())
@@ -1071,7 +1515,7 @@ class FileBrowserApp(App):
     def action_fuzzy_find(self):
         """Show fuzzy finder dialog."""
         file_list = self.query_one(FileList)
-        self.push_screen(FuzzyFinderScreen(file_list.current_path), self.handle_fuzzy_selection)
+        self.push_screen(FuzzyFinderScreen(file_list.current_path, file_list.show_hidden), self.handle_fuzzy_selection)
 
     def handle_fuzzy_selection(self, selected_path: Path | None):
         """Handle the result from fuzzy finder."""
@@ -1089,12 +1533,9 @@ class FileBrowserApp(App):
             file_list.current_path = selected_path.parent
             file_list.refresh_list()
             # Find and select the file in the list
-            try:
-                file_index = file_list.entries.index(selected_path)
-                file_list.selected_index = file_index
-                file_list.render_list()
-            except (ValueError, IndexError):
-                pass
+            file_index = file_list._entry_index.get(str(selected_path))
+            if file_index is not None:
+                file_list.set_selection(file_index)
 
         self.update_preview()
         self.update_info_boxes()
@@ -1103,15 +1544,42 @@ class FileBrowserApp(App):
         """Move selection down in file list."""
         file_list = self.query_one(FileList)
         if file_list.move_selection_down():
-            self.update_preview()
-            self.update_info_boxes()
+            self._schedule_refresh()
 
     def action_move_up(self):
         """Move selection up in file list."""
         file_list = self.query_one(FileList)
         if file_list.move_selection_up():
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Refresh the preview and info boxes, coalescing rapid moves.
+
+        The first move in a burst refreshes immediately; further moves
+        within REFRESH_DELAY only mark the panes dirty, and they are
+        refreshed once when the timer fires.
+        """
+        if self._refresh_timer is None:
+            self.update_preview()
+            self.update_info_boxes()
+            self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self._flush_dirty)
+        else:
+            self._preview_dirty = True
+            self._info_dirty = True
+
+    def _flush_dirty(self):
+        """Apply refreshes deferred by _schedule_refresh."""
+        self._refresh_timer = None
+        if not (self._preview_dirty or self._info_dirty):
+            return
+        if self._preview_dirty:
+            self._preview_dirty = False
             self.update_preview()
+        if self._info_dirty:
+            self._info_dirty = False
             self.update_info_boxes()
+        # Keep throttling while the key is still repeating
+        self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self._flush_dirty)
 
     def action_select(self):
         """Select/enter the current item."""
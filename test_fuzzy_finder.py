@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the fuzzy finder in file browser TUI."""
+
+import pytest
+from textual.widgets import Input
+from main import FileBrowserApp, FuzzyFinderScreen
+
+# "xyz.txt" scores 0 for "a" but passes the cutoff for "ax", so results
+# for "ax" must not depend on the results for "a"
+_TREE_FILES = (
+    "alpha.txt",
+    "xyz.txt",
+    "docs/axis.md",
+    "docs/guide.md",
+    "src/app.py",
+    "src/axe.py",
+    "src/zeta.py",
+)
+
+
+@pytest.fixture
+def tree(make_tree):
+    """A small directory tree to search."""
+    return make_tree(_TREE_FILES)
+
+
+async def _settle(pilot):
+    """Wait for pending searches and the messages they post."""
+    await pilot.pause(FuzzyFinderScreen.SEARCH_DELAY * 2)
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+async def _finder_results(tree, query, one_key_at_a_time):
+    """Return the paths the finder lists for query."""
+    app = FileBrowserApp()
+    async with app.run_test() as pilot:
+        finder = FuzzyFinderScreen(tree)
+        await app.push_screen(finder)
+        await _settle(pilot)
+        if one_key_at_a_time:
+            for key in query:
+                await pilot.press(key)
+                await _settle(pilot)
+        else:
+            finder.query_one(Input).value = query
+            await _settle(pilot)
+        return finder.filtered_files
+
+
+# Each tree has fewer than MIN_PARTIAL_HITS files, so every search also
+# adds WRatio fallback hits, which must not limit later searches either
+@pytest.mark.parametrize("query, expected", [
+    ("ax", "xyz.txt"),
+    ("gdiem", "docs/guide.md"),
+])
+async def test_results_do_not_depend_on_typing_speed(tree, query, expected):
+    """Test that typing a query key by key matches entering it at once."""
+    typed = await _finder_results(tree, query, one_key_at_a_time=True)
+    pasted = await _finder_results(tree, query, one_key_at_a_time=False)
+    assert typed == pasted
+    assert str(tree / expected) in typed
+
+
+async def test_symlinked_directory_is_labelled_as_directory(make_tree):
+    """Test that a symlink to a directory is listed like a directory."""
+    root = make_tree(["real/file.txt"])
+    link = root / "link"
+    link.symlink_to(root / "real", target_is_directory=True)
+
+    app = FileBrowserApp()
+    async with app.run_test() as pilot:
+        finder = FuzzyFinderScreen(root)
+        await app.push_screen(finder)
+        await _settle(pilot)
+        labels = {
+            record[1]: finder._make_label(index)
+            for index, record in enumerate(finder.all_files)
+        }
+
+    assert labels[str(link)].startswith(" ▸ ")
+    assert "link/" in labels[str(link)]
+    # The walk does not follow the link
+    assert str(link / "file.txt") not in labels
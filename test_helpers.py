@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for the module-level helpers in file browser TUI."""
+
+import os
+import stat
+
+import pytest
+from main import FuzzyFinderScreen, _format_perms, _format_size, _walk_tree
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, "0 B"),
+    (9, "9 B"),
+    (1023, "1023 B"),
+    (1024, "1.0 KB"),
+    (1048575, "1024.0 KB"),
+    (1048576, "1.0 MB"),
+    (1 << 40, "1.0 TB"),
+    # Units stop at TB
+    (1 << 50, "1024.0 TB"),
+])
+def test_format_size(size, expected):
+    """Test size formatting at unit boundaries."""
+    assert _format_size(size) == expected
+
+
+def test_format_perms_matches_filemode():
+    """Test that every permission combination matches stat.filemode."""
+    for mode in range(0o1000):
+        assert _format_perms(mode) == stat.filemode(mode)[1:]
+
+
+@pytest.fixture
+def tree(make_tree):
+    """A tree with hidden entries, directories the walk skips and a symlink."""
+    root = make_tree((
+        "src/main.py",
+        "src/__pycache__/main.cpython-313.pyc",
+        "docs/readme.md",
+        ".git/objects/ab",
+        ".venv/bin/python",
+        "node_modules/pkg/index.js",
+        ".config/settings.toml",
+        ".env",
+    ))
+    (root / "docs-link").symlink_to(root / "docs", target_is_directory=True)
+    return root
+
+
+def _walked(root, show_hidden):
+    """Return the paths _walk_tree yields, relative to root."""
+    entries = _walk_tree(str(root), FuzzyFinderScreen.SKIP_DIRS, show_hidden)
+    return {os.path.relpath(entry.path, root) for entry in entries}
+
+
+def test_walk_tree_prunes_hidden_and_skip_dirs(tree):
+    """Test that hidden entries, SKIP_DIRS and symlinked directories are not entered."""
+    assert _walked(tree, show_hidden=False) == {
+        "src",
+        "src/main.py",
+        "docs",
+        "docs/readme.md",
+        "docs-link",
+    }
+
+
+def test_walk_tree_show_hidden(tree):
+    """Test that show_hidden includes dotfiles but still prunes SKIP_DIRS."""
+    assert _walked(tree, show_hidden=True) == {
+        "src",
+        "src/main.py",
+        "docs",
+        "docs/readme.md",
+        "docs-link",
+        ".config",
+        ".config/settings.toml",
+        ".env",
+    }
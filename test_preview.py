@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the file preview pane in file browser TUI."""
+
+import os
+
+import pytest
+from main import FileBrowserApp, FilePreview
+
+_MARKER = "... (preview truncated)"
+
+
+async def _preview(pilot, path):
+    """Preview path and return what the pane shows."""
+    preview = pilot.app.query_one(FilePreview)
+    preview.preview_file(path)
+    await pilot.pause()
+    return preview.content
+
+
+def _limits(pilot):
+    """Return the (lines, bytes) read limits for the current pane."""
+    lines = pilot.app.query_one(FilePreview)._max_preview_lines()
+    return lines, lines * FilePreview.AVG_LINE_BYTES
+
+
+async def test_long_file_is_cut_to_the_pane(tmp_path):
+    """Test that a long file shows only the lines that fit, then the marker."""
+    path = tmp_path / "long.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(5000)))
+
+    async with FileBrowserApp().run_test(size=(120, 30)) as pilot:
+        max_lines, _ = _limits(pilot)
+        lines = (await _preview(pilot, path)).code.split("\n")
+
+    assert max_lines < FilePreview.PREVIEW_LINES
+    assert lines[:max_lines] == [f"line {i}" for i in range(max_lines)]
+    assert lines[max_lines:] == [_MARKER]
+
+
+@pytest.mark.parametrize("make_text, truncated", [
+    (lambda lines, size: "x\n" * lines, False),
+    (lambda lines, size: "x\n" * (lines + 1), True),
+    (lambda lines, size: "x" * size, False),
+    (lambda lines, size: "x" * (size + 1), True),
+], ids=["line-limit", "line-limit-plus-one", "byte-limit", "byte-limit-plus-one"])
+async def test_truncation_marker_at_the_limits(tmp_path, make_text, truncated):
+    """Test that only files past the line or byte limit get the marker."""
+    path = tmp_path / "edge.txt"
+
+    async with FileBrowserApp().run_test(size=(120, 30)) as pilot:
+        path.write_text(make_text(*_limits(pilot)))
+        code = (await _preview(pilot, path)).code
+
+    assert code.endswith(_MARKER) == truncated
+
+
+async def test_nul_byte_file_is_binary(tmp_path):
+    """Test that a file containing NUL is reported as binary."""
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"header\x00\x01\x02")
+
+    async with FileBrowserApp().run_test(size=(120, 30)) as pilot:
+        content = await _preview(pilot, path)
+
+    assert str(content).startswith("[yellow]Binary file[/yellow]")
+
+
+async def test_preview_cache_follows_file_changes(tmp_path):
+    """Test that an unchanged file reuses its preview and a changed one does not."""
+    path = tmp_path / "cached.py"
+    path.write_text("a = 1\n")
+
+    async with FileBrowserApp().run_test(size=(120, 30)) as pilot:
+        first = await _preview(pilot, path)
+        assert await _preview(pilot, path) is first
+
+        path.write_text("a = 22\n")
+        stat_info = path.stat()
+        # Make sure the change is visible even on coarse mtime clocks
+        os.utime(path, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+        changed = await _preview(pilot, path)
+
+    assert changed is not first
+    assert changed.code.startswith("a = 22")
+
+
+async def test_growing_terminal_shows_more_lines(tmp_path):
+    """Test that the preview is read again when the pane gets taller."""
+    path = tmp_path / "long.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(5000)))
+
+    async with FileBrowserApp().run_test(size=(120, 30)) as pilot:
+        before = (await _preview(pilot, path)).code.count("\n")
+        await pilot.resize_terminal(120, 90)
+        await pilot.pause()
+        after = pilot.app.query_one(FilePreview).content.code.count("\n")
+
+    assert after > before